@@ -7,16 +7,55 @@ class Config:
     # Scraper settings
     MAX_PAGES = int(os.getenv('MAX_PAGES', '3'))
     HEADLESS_MODE = os.getenv('HEADLESS_MODE', 'True').lower() == 'true'
-    REQUEST_DELAY = int(os.getenv('REQUEST_DELAY', '2'))
+    REQUEST_DELAY = float(os.getenv('REQUEST_DELAY', '0.8'))
+    MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
+    MAX_RETRY_AFTER = float(os.getenv('MAX_RETRY_AFTER', '60'))
+    MAX_WORKERS = int(os.getenv('MAX_WORKERS', '4'))
+    PARSE_QUEUE_SIZE = int(os.getenv('PARSE_QUEUE_SIZE', '4'))
+    REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '10'))
     
     # Flipkart settings
     BASE_URL = "https://www.flipkart.com"
     
+    # HTTP session settings
+    REQUEST_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
+    }
+    
+    # Lower-case text that marks a 200 response as a bot challenge rather than
+    # a real (possibly empty) search listing
+    CHALLENGE_MARKERS = [
+        "captcha",
+        "are you a human",
+        "access denied",
+        "unusual traffic"
+    ]
+    
     # Chrome driver settings
     CHROME_OPTIONS = [
         "--no-sandbox",
         "--disable-dev-shm-usage",
         "--disable-gpu",
         "--window-size=1920,1080",
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    ]
\ No newline at end of file
+        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        # Only DOM text and image URLs are needed, so skip fetching/decoding images
+        "--blink-settings=imagesEnabled=false",
+        "--disable-extensions",
+        "--disable-infobars",
+        "--disable-popup-blocking",
+        "--disable-notifications",
+        "--mute-audio",
+        # Keep fetched resources cached across pages of the same session
+        "--disk-cache-size=67108864"
+    ]
+    
+    # Chrome profile preferences (2 = block)
+    CHROME_PREFS = {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    }
\ No newline at end of file
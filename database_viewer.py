@@ -1,8 +1,11 @@
+import csv
 import sqlite3
 import pandas as pd
 from datetime import datetime
 from config import Config
 class DatabaseViewer:
+    CSV_CHUNK_SIZE = 10_000
+    
     def __init__(self, db_path: str = Config.DATABASE_PATH):
         """ Initializes the DatabaseViewer with the path to the database."""
         self.db_path = db_path
@@ -10,14 +13,16 @@ class DatabaseViewer:
     def view_all_products(self):
         try:
             with sqlite3.connect(self.db_path) as conn:
-                df = pd.read_sql_query("SELECT * FROM product_info ORDER BY created_at DESC", conn)
-                print(f"Total products: {len(df)}")
+                total = conn.execute("SELECT COUNT(*) FROM product_info").fetchone()[0]
+                # Only the preview is loaded into memory; the export below is streamed
+                df = pd.read_sql_query("SELECT * FROM product_info ORDER BY created_at DESC LIMIT 10", conn)
+                print(f"Total products: {total}")
                 print("\nLatest 10 products:")
-                print(df.head(10).to_string(index=False))
+                print(df.to_string(index=False))
                 # Ask user if they want to save all data to CSV (default yes)
                 save_csv = input("\nDo you want to save all products to CSV? (y/n, default: y): ").strip().lower()
                 if save_csv == '' or save_csv == 'y':
-                    df.to_csv("all_products.csv", index=False)
+                    self.export_csv(conn, "all_products.csv")
                     print("All products saved to all_products.csv")
                 else:
                     print("Data not saved to CSV.")
@@ -26,22 +31,34 @@ class DatabaseViewer:
             print(f"Error viewing products: {e}")
             return None
     
+    def export_csv(self, conn: sqlite3.Connection, path: str) -> None:
+        """Stream every product straight from the cursor into a CSV file."""
+        cursor = conn.execute("SELECT * FROM product_info ORDER BY created_at DESC")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([column[0] for column in cursor.description])
+            while True:
+                rows = cursor.fetchmany(self.CSV_CHUNK_SIZE)
+                if not rows:
+                    break
+                writer.writerows(rows)
+    
     def get_stats(self):
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                # Total count
-                cursor.execute("SELECT COUNT(*) FROM product_info")
-                total = cursor.fetchone()[0]
-                
-                # Products with prices
-                cursor.execute("SELECT COUNT(*) FROM product_info WHERE price IS NOT NULL AND price != ''")
-                with_price = cursor.fetchone()[0]
-                
-                # Products with images
-                cursor.execute("SELECT COUNT(*) FROM product_info WHERE image_url IS NOT NULL AND image_url != ''")
-                with_image = cursor.fetchone()[0]
+                # Total, priced and imaged counts in a single pass over the table
+                cursor.execute("""
+                    SELECT COUNT(*),
+                           SUM(CASE WHEN price IS NOT NULL AND price != '' THEN 1 ELSE 0 END),
+                           SUM(CASE WHEN image_url IS NOT NULL AND image_url != '' THEN 1 ELSE 0 END)
+                    FROM product_info
+                """)
+                total, with_price, with_image = cursor.fetchone()
+                # SUM() is NULL on an empty table
+                with_price = with_price or 0
+                with_image = with_image or 0
                 
                 print(f"Database Statistics:")
                 print(f"Total products: {total}")
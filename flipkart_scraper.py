@@ -1,8 +1,12 @@
 import sqlite3
 import time
 import logging
-from datetime import datetime
-from typing import List, Dict, Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, List, Dict, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -11,8 +15,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from bs4 import BeautifulSoup
+import soupsieve
 import requests
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urljoin, urlencode
 import os
 from config import Config
 
@@ -27,68 +34,132 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# A scraped product as (title, image_url, price); missing fields are ''
+Product = Tuple[str, str, str]
+
+# Product selectors, compiled once; each alternative covers a Flipkart layout variant
+CONTAINER_SEL = soupsieve.compile("div[data-id]")
+TITLE_SEL = soupsieve.compile("div.KzDlHZ, a.wjcEIp, a.WKTcLC, div._4rR01T")
+PRICE_SEL = soupsieve.compile("div.Nx9bqj, div._30jeq3, div._1_WHN1")
+
+INSERT_SQL = '''
+    INSERT OR IGNORE INTO product_info (title, image_url, price, created_at)
+    VALUES (?, ?, ?, ?)
+'''
+
 
 class DatabaseManager:
     """Handles database operations for product data storage."""
     
+    INSERT_CHUNK_SIZE = 10_000
+    
     def __init__(self, db_path: str = Config.DATABASE_PATH):
         self.db_path = db_path
+        self._lock = threading.Lock()
+        self._closed = False
+        self._conn = self._connect()
         self.init_database()
+        # One cursor shared by every batch, so inserts don't allocate a new cursor per
+        # call; statement preparation is cached per connection by sqlite3 either way
+        self._insert_cursor = self._conn.cursor()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection tuned for bulk writes."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
     
     def init_database(self) -> None:
         """Initialize the database and create product_info table."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS product_info (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        title TEXT NOT NULL,
-                        image_url TEXT,
-                        price TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.execute('''
+                        CREATE TABLE IF NOT EXISTS product_info (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            title TEXT NOT NULL,
+                            image_url TEXT,
+                            price TEXT,
+                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        )
+                    ''')
+                    has_unique_index = self._conn.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_product_unique'"
+                    ).fetchone() is not None
+                    if not has_unique_index:
+                        # Databases created before the unique index may hold repeated
+                        # scrapes; keep the earliest copy so the index can be built.
+                        # NULL prices never collide in a unique index, so leave them.
+                        cursor = self._conn.execute('''
+                            DELETE FROM product_info
+                            WHERE price IS NOT NULL AND id NOT IN (
+                                SELECT MIN(id) FROM product_info
+                                WHERE price IS NOT NULL
+                                GROUP BY title, price
+                            )
+                        ''')
+                        if cursor.rowcount:
+                            logger.warning(f"Removed {cursor.rowcount} duplicate products "
+                                           "before creating the unique index")
+                    self._conn.execute(
+                        "CREATE UNIQUE INDEX IF NOT EXISTS idx_product_unique ON product_info(title, price)"
+                    )
+                    self._conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_created_at ON product_info(created_at)"
                     )
-                ''')
-                conn.commit()
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    if self._conn.in_transaction:
+                        self._conn.execute("ROLLBACK")
+                    raise
                 logger.info("Database initialized successfully")
         except sqlite3.Error as e:
             logger.error(f"Database initialization error: {e}")
             raise
     
     def insert_product(self, title: str, image_url: str, price: str) -> bool:
-        """Insert a single product into the database."""
+        """Insert a single product, returning False if it was a duplicate."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO product_info (title, image_url, price, created_at)
-                    VALUES (?, ?, ?, ?)
-                ''', (title, image_url, price, datetime.now()))
-                conn.commit()
-                return True
+            with self._lock:
+                cursor = self._conn.execute(INSERT_SQL, (title, image_url, price, datetime.now()))
+                return cursor.rowcount == 1
         except sqlite3.Error as e:
             logger.error(f"Error inserting product: {e}")
             return False
     
-    def insert_products_batch(self, products: List[Dict[str, str]]) -> int:
-        """Insert multiple products in batch."""
+    def insert_products_batch(self, products: List[Product]) -> int:
+        """Insert multiple products in batch and return how many were new."""
         inserted_count = 0
+        now = datetime.now().isoformat(sep=' ')
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                for product in products:
-                    cursor.execute('''
-                        INSERT INTO product_info (title, image_url, price, created_at)
-                        VALUES (?, ?, ?, ?)
-                    ''', (
-                        product.get('title', ''),
-                        product.get('image_url', ''),
-                        product.get('price', ''),
-                        datetime.now()
-                    ))
-                    inserted_count += 1
-                conn.commit()
-                logger.info(f"Successfully inserted {inserted_count} products")
+            with self._lock:
+                # Commit in fixed-size chunks to bound per-transaction work and WAL growth
+                for start in range(0, len(products), self.INSERT_CHUNK_SIZE):
+                    chunk = products[start:start + self.INSERT_CHUNK_SIZE]
+                    rows = ((title, image_url, price, now) for title, image_url, price in chunk)
+                    # Transaction control runs on the insert cursor too, so no
+                    # temporary cursors are created per chunk
+                    self._insert_cursor.execute("BEGIN IMMEDIATE")
+                    try:
+                        self._insert_cursor.executemany(INSERT_SQL, rows)
+                        # rowcount excludes rows skipped as duplicates; read it
+                        # before COMMIT runs on the same cursor and resets it
+                        chunk_count = self._insert_cursor.rowcount
+                        self._insert_cursor.execute("COMMIT")
+                    except BaseException:
+                        # Roll back on any failure (e.g. a malformed product tuple), not
+                        # only sqlite3.Error; otherwise the shared autocommit connection
+                        # stays inside the transaction and every later BEGIN fails
+                        if self._conn.in_transaction:
+                            self._insert_cursor.execute("ROLLBACK")
+                        raise
+                    inserted_count += chunk_count
+                logger.info(f"Successfully inserted {inserted_count} products "
+                            f"({len(products) - inserted_count} duplicates skipped)")
         except sqlite3.Error as e:
             logger.error(f"Batch insert error: {e}")
         return inserted_count
@@ -96,10 +167,8 @@ class DatabaseManager:
     def get_product_count(self) -> int:
         """Get total number of products in database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM product_info")
-                return cursor.fetchone()[0]
+            with self._lock:
+                return self._conn.execute("SELECT COUNT(*) FROM product_info").fetchone()[0]
         except sqlite3.Error as e:
             logger.error(f"Error getting product count: {e}")
             return 0
@@ -107,10 +176,8 @@ class DatabaseManager:
     def fetch_all_products_sorted(self) -> list:
         """Fetch all products sorted by id ASC (insertion order)."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM product_info ORDER BY id ASC")
-                return cursor.fetchall()
+            with self._lock:
+                return self._conn.execute("SELECT * FROM product_info ORDER BY id ASC").fetchall()
         except sqlite3.Error as e:
             logger.error(f"Error fetching sorted products: {e}")
             return []
@@ -118,14 +185,88 @@ class DatabaseManager:
     def clear_products(self):
         """Delete all products from the product_info table and reset autoincrement id."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM product_info")
-                cursor.execute("DELETE FROM sqlite_sequence WHERE name='product_info'")
-                conn.commit()
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.execute("DELETE FROM product_info")
+                    self._conn.execute("DELETE FROM sqlite_sequence WHERE name='product_info'")
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    if self._conn.in_transaction:
+                        self._conn.execute("ROLLBACK")
+                    raise
                 logger.info("All products deleted and autoincrement id reset.")
         except sqlite3.Error as e:
             logger.error(f"Error clearing products: {e}")
+    
+    def close(self) -> None:
+        """Close the shared database connection."""
+        with self._lock:
+            if not self._closed:
+                # The closed connection stays referenced, so later calls fail with
+                # sqlite3.ProgrammingError, which the methods above already handle
+                self._insert_cursor.close()
+                self._conn.close()
+                self._closed = True
+                logger.info("Database connection closed")
+
+class RateLimiter:
+    """Spaces out request start times across threads.
+    
+    Only the time since the previous request start is waited out, so a slow
+    page does not add a fixed delay on top of its own latency.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+    
+    def _reserve(self) -> float:
+        """Claim the next free start time; caller must hold the lock."""
+        slot = max(time.monotonic(), self._next_slot, self._blocked_until)
+        self._next_slot = slot + self.interval
+        return slot
+    
+    def wait(self) -> None:
+        """Block until the caller may start its next request."""
+        with self._lock:
+            slot = self._reserve()
+        while True:
+            delay = slot - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            with self._lock:
+                # A defer() while we slept invalidates slots reserved before it;
+                # queue up again behind the block instead of firing anyway
+                if self._blocked_until <= slot:
+                    return
+                slot = self._reserve()
+    
+    def defer(self, seconds: float) -> None:
+        """Hold back every caller, including already-waiting ones, for `seconds`."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._next_slot = max(self._next_slot, self._blocked_until)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) to a delay in seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 
 class FlipkartScraper:
     """Main scraper class for Flipkart product data extraction."""
@@ -134,11 +275,36 @@ class FlipkartScraper:
         self.base_url = Config.BASE_URL
         self.headless = headless
         self.driver = None
+        self._driver_lock = threading.Lock()
+        self.rate_limiter = RateLimiter(Config.REQUEST_DELAY)
         self.db_manager = DatabaseManager()
-        self.setup_driver()
+        self.session = self.setup_session()
+    
+    def setup_session(self) -> requests.Session:
+        """Setup a keep-alive HTTP session for fetching listing pages."""
+        session = requests.Session()
+        session.headers.update(Config.REQUEST_HEADERS)
+        # Pool enough connections for every page worker so keep-alive and TLS
+        # sessions carry across pages instead of reconnecting per request.
+        # urllib3 only retries connection/read errors; 429/503 responses are
+        # returned to fetch_page, which caps Retry-After and backs off all workers.
+        adapter = HTTPAdapter(
+            pool_connections=Config.MAX_WORKERS,
+            pool_maxsize=Config.MAX_WORKERS * 2,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status=0,
+                raise_on_status=False,
+                respect_retry_after_header=False
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
     
     def setup_driver(self) -> None:
-        """Setup Chrome WebDriver with appropriate options."""
+        """Setup Chrome WebDriver, used as a fallback when plain HTTP is blocked."""
         try:
             chrome_options = Options()
             if self.headless:
@@ -146,116 +312,231 @@ class FlipkartScraper:
             # Add options from Config.CHROME_OPTIONS
             for opt in Config.CHROME_OPTIONS:
                 chrome_options.add_argument(opt)
+            chrome_options.add_experimental_option("prefs", Config.CHROME_PREFS)
+            # Return from driver.get() immediately; scrape_page waits for products itself
+            chrome_options.page_load_strategy = "none"
             
             # Initialize driver
             self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.implicitly_wait(10)
             logger.info("WebDriver setup completed")
         except Exception as e:
             logger.error(f"WebDriver setup failed: {e}")
             raise
     
-    def search_products(self, keyword: str, max_pages: int = 3) -> List[Dict[str, str]]:
+    def search_products(self, keyword: str, max_pages: int = 3) -> List[Product]:
         """Search for products and scrape data from multiple pages."""
         all_products = []
+        urls = [self.build_search_url(keyword, page_num) for page_num in range(1, max_pages + 1)]
+        logger.info(f"Scraping {len(urls)} pages for keyword: {keyword}")
         
-        for page_num in range(1, max_pages + 1):
-            logger.info(f"Scraping page {page_num} for keyword: {keyword}")
-            
-            # Construct search URL
-            if page_num == 1:
-                search_url = f"{self.base_url}/search?q={keyword}"
-            else:
-                search_url = f"{self.base_url}/search?q={keyword}&page={page_num}"
-            
-            products = self.scrape_page(search_url)
+        # Fetch workers only download pages and hand the HTML to a single parse
+        # worker, so network/browser time overlaps with parsing instead of adding to it
+        page_results = [[] for _ in urls]
+        parse_queue = queue.Queue(maxsize=Config.PARSE_QUEUE_SIZE)
+        # Index of the first page that came back empty; later pages are past the
+        # end of the results, so their requests are skipped once it is known
+        cutoff = [len(urls)]
+        cutoff_lock = threading.Lock()
+        parser = threading.Thread(target=self._parse_worker, args=(parse_queue, page_results), daemon=True)
+        parser.start()
+        
+        try:
+            # Pages are network-bound, so fetch them concurrently; the rate limiter
+            # keeps request starts spaced out
+            workers = max(1, min(max_pages, Config.MAX_WORKERS))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._fetch_to_queue, parse_queue, index, url, lambda index=index: index > cutoff[0]
+                    ): index
+                    for index, url in enumerate(urls)
+                }
+                for future in as_completed(futures):
+                    if future.cancelled() or future.result():
+                        continue
+                    empty_index = futures[future]
+                    with cutoff_lock:
+                        cutoff[0] = min(cutoff[0], empty_index)
+                    for other, other_index in futures.items():
+                        if other_index > empty_index:
+                            other.cancel()
+        finally:
+            parse_queue.put(None)
+            parser.join()
+        
+        for page_num, products in enumerate(page_results, start=1):
             if products:
                 all_products.extend(products)
                 logger.info(f"Found {len(products)} products on page {page_num}")
             else:
                 logger.warning(f"No products found on page {page_num}")
                 break
-            
-            # Add delay between requests
-            time.sleep(Config.REQUEST_DELAY)
         
         return all_products
     
-    def scrape_page(self, url: str) -> List[Dict[str, str]]:
+    def _fetch_to_queue(self, parse_queue: queue.Queue, index: int, url: str,
+                        skip: Callable[[], bool]) -> bool:
+        """Fetch one page and queue its HTML for the parse worker; False if it had none."""
+        html = self.fetch_html(url, skip)
+        if html:
+            parse_queue.put((index, html))
+        return bool(html)
+    
+    def _parse_worker(self, parse_queue: queue.Queue, page_results: List[List[Product]]) -> None:
+        """Parse queued pages into page_results until a None sentinel arrives."""
+        while True:
+            item = parse_queue.get()
+            if item is None:
+                break
+            index, html = item
+            page_results[index] = self.parse_products(html)
+    
+    def build_search_url(self, keyword: str, page_num: int) -> str:
+        """Construct the search URL for a results page."""
+        params = {"q": keyword}
+        if page_num > 1:
+            params["page"] = page_num
+        return f"{self.base_url}/search?{urlencode(params)}"
+    
+    def scrape_page(self, url: str) -> List[Product]:
         """Scrape products from a single page."""
+        html = self.fetch_html(url)
+        return self.parse_products(html) if html else []
+    
+    def fetch_html(self, url: str, skip: Optional[Callable[[], bool]] = None) -> Optional[str]:
+        """Fetch a listing page over HTTP, falling back to the browser if needed.
+        
+        `skip` is checked right before each request goes out; when it returns
+        True the page is treated as empty and nothing is sent.
+        """
+        html = self.fetch_page(url, skip)
+        if html is None:
+            # Plain HTTP was blocked or challenged; let a real browser try.
+            # An empty string means a real page without products, so no fallback.
+            html = self.fetch_page_with_browser(url, skip)
+        return html
+    
+    def parse_products(self, html: str) -> List[Product]:
+        """Parse all valid products out of a listing page's HTML."""
         products = []
         
         try:
-            self.driver.get(url)
-            
-            # Wait for products to load
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-id]"))
-            )
-            
-            # Get page source and parse with BeautifulSoup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Parse page source with BeautifulSoup using the C-backed lxml parser
+            soup = BeautifulSoup(html, 'lxml')
             
             # Find product containers
-            product_containers = soup.find_all('div', {'data-id': True})
+            product_containers = CONTAINER_SEL.select(soup)
             
             for container in product_containers:
                 product = self.extract_product_info(container)
                 if product and self.validate_product(product):
                     products.append(product)
             
-        except TimeoutException:
-            logger.error(f"Timeout waiting for page to load: {url}")
         except Exception as e:
-            logger.error(f"Error scraping page {url}: {e}")
+            logger.error(f"Error parsing page: {e}")
         
         return products
     
-    def extract_product_info(self, container) -> Optional[Dict[str, str]]:
+    def fetch_page(self, url: str, skip: Optional[Callable[[], bool]] = None) -> Optional[str]:
+        """Fetch listing HTML over HTTP; '' if it has no products, None if blocked."""
+        for attempt in range(Config.MAX_RETRIES + 1):
+            self.rate_limiter.wait()
+            if skip is not None and skip():
+                return ''
+            try:
+                response = self.session.get(url, timeout=Config.REQUEST_TIMEOUT)
+            except requests.RequestException as e:
+                logger.warning(f"HTTP request failed for {url}: {e}")
+                return None
+            
+            if response.status_code not in (429, 503) or attempt == Config.MAX_RETRIES:
+                break
+            # Server asked us to slow down; hold back every worker, not just this one
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = Config.REQUEST_DELAY * 2 ** (attempt + 1)
+            delay = min(delay, Config.MAX_RETRY_AFTER)
+            logger.warning(f"HTTP {response.status_code} for {url}, retrying in {delay:.1f}s")
+            self.rate_limiter.defer(delay)
+        
+        if response.status_code != 200:
+            logger.warning(f"HTTP fetch returned status {response.status_code}: {url}")
+            return None
+        html = response.text
+        if 'data-id' in html:
+            return html
+        lowered = html.lower()
+        if any(marker in lowered for marker in Config.CHALLENGE_MARKERS):
+            logger.warning(f"HTTP fetch hit a bot challenge page: {url}")
+            return None
+        # A genuine listing with no results (e.g. past the last page); the browser
+        # would find nothing either, so report it as empty instead of falling back
+        return ''
+    
+    def fetch_page_with_browser(self, url: str, skip: Optional[Callable[[], bool]] = None) -> Optional[str]:
+        """Fetch a page through Selenium, starting the browser on first use."""
+        try:
+            # WebDriver is not thread-safe; page workers share one browser in turn
+            with self._driver_lock:
+                self.rate_limiter.wait()
+                if skip is not None and skip():
+                    return ''
+                if self.driver is None:
+                    self.setup_driver()
+                # With page_load_strategy "none", get() returns before the old
+                # document is replaced, so the [data-id] wait below could match
+                # the previous page; wait for its root element to go stale first
+                old_root = self.driver.find_element(By.TAG_NAME, "html")
+                self.driver.get(url)
+                wait = WebDriverWait(self.driver, 15)
+                wait.until(EC.staleness_of(old_root))
+                
+                # Wait for products to load
+                wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "[data-id]"))
+                )
+                # Products are in the DOM; stop loading ads, trackers and lazy images
+                self.driver.execute_script("window.stop();")
+                return self.driver.page_source
+        except TimeoutException:
+            logger.error(f"Timeout waiting for page to load: {url}")
+        except Exception as e:
+            logger.error(f"Browser fetch failed for {url}: {e}")
+        return None
+    
+    def extract_product_info(self, container) -> Optional[Product]:
         """Extract product information from a container element."""
         try:
-            product = {}
-            
             # Extract title
-            title_elem = container.find('div', class_='KzDlHZ') or \
-                        container.find('a', class_='wjcEIp') or \
-                        container.find('a', class_='WKTcLC')
-            
-            if title_elem:
-                product['title'] = title_elem.get_text(strip=True)
-            else:
-                # Try alternative selectors
-                title_elem = container.find('div', class_='_4rR01T')
-                if title_elem:
-                    product['title'] = title_elem.get_text(strip=True)
+            title_elem = TITLE_SEL.select_one(container)
+            title = title_elem.get_text(strip=True) if title_elem else ''
+            if not title:
+                return None
             
             # Extract image URL
+            image_url = ''
             img_elem = container.find('img')
             if img_elem:
                 img_src = img_elem.get('src') or img_elem.get('data-src')
                 if img_src:
-                    product['image_url'] = img_src if img_src.startswith('http') else urljoin(self.base_url, img_src)
+                    image_url = img_src if img_src.startswith('http') else urljoin(self.base_url, img_src)
             
             # Extract price
-            price_elem = container.find('div', class_='Nx9bqj') or \
-                        container.find('div', class_='_30jeq3') or \
-                        container.find('div', class_='_1_WHN1')
-            
-            if price_elem:
-                product['price'] = price_elem.get_text(strip=True)
+            price_elem = PRICE_SEL.select_one(container)
+            price = price_elem.get_text(strip=True) if price_elem else ''
             
-            return product if product.get('title') else None
+            return (title, image_url, price)
             
         except Exception as e:
             logger.error(f"Error extracting product info: {e}")
             return None
     
-    def validate_product(self, product: Dict[str, str]) -> bool:
+    def validate_product(self, product: Product) -> bool:
         """Validate if product data is complete and valid."""
-        required_fields = ['title']
-        return all(product.get(field) for field in required_fields)
+        title, _, _ = product
+        return bool(title)
     
-    def save_products(self, products: List[Dict[str, str]]) -> int:
+    def save_products(self, products: List[Product]) -> int:
         """Save products to database."""
         if not products:
             logger.warning("No products to save")
@@ -294,9 +575,12 @@ class FlipkartScraper:
     
     def close(self) -> None:
         """Clean up resources."""
+        self.session.close()
         if self.driver:
             self.driver.quit()
+            self.driver = None
             logger.info("WebDriver closed")
+        self.db_manager.close()
 
 
 def main():
@@ -318,6 +602,7 @@ def main():
             print("Old data will be kept. New data will be appended.")
     else:
         print("No existing database found. A new database will be created.")
+    db_manager.close()
     # Get user input
     keyword = input("Enter search keyword (default: smartphone): ").strip()
     if not keyword: